@@ -1,5 +1,5 @@
-from .core import clean_and_validate
+from .core import clean_and_validate, clean_and_validate_streaming, iter_clean_and_validate
 from .schema import Schema
-__all__ = ['clean_and_validate', 'Schema']
+__all__ = ['clean_and_validate', 'clean_and_validate_streaming', 'iter_clean_and_validate', 'Schema']
 
 __version__ = '0.2.4'
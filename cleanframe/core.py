@@ -1,10 +1,29 @@
+import os
+from contextlib import nullcontext
+import numpy as np
 import pandas as pd
-from typing import Tuple
-from .schema import Schema
-from .reporting import log_info, log_warning
-from .validators import validate_column, validate_dataframe
+from typing import Iterator, Optional, Sequence, Tuple, Union
+from .schema import CompiledSchema, Schema
+from .reporting import live_console, log_info
+from .validators import EARLY_DROP_STAGES, LATE_STAGES, run_column_steps, run_column_steps_parallel, validate_dataframe
+from .transformers import allowed_values_index, finalize_conversion
+from .utils import copy_on_write, copy_on_write_enabled
 
-def clean_and_validate(df: pd.DataFrame, schema: Schema) -> Tuple[pd.DataFrame, list[str]]:
+# Below these sizes the thread pool's fixed overhead outweighs the parallel speedup
+_PARALLEL_MIN_COLUMNS = 4
+_PARALLEL_MIN_ROWS = 50_000
+
+# Rule dtypes whose columns are read from CSV files as text, keeping values like leading zeros
+_TEXT_DTYPES = {"str", "string", "object", "category"}
+
+
+def clean_and_validate(
+    df: pd.DataFrame,
+    schema: Union[Schema, CompiledSchema],
+    max_workers: Optional[int] = None,
+    enable_live_console: Optional[bool] = None,
+    early_drop: bool = False,
+) -> Tuple[pd.DataFrame, list[str]]:
     """Cleans and validates a pandas DataFrame based on a user-defined schema.
 
     This is the core function of the library. It applies a series of cleaning and 
@@ -14,9 +33,28 @@ def clean_and_validate(df: pd.DataFrame, schema: Schema) -> Tuple[pd.DataFrame,
 
     Args:
         df (pd.DataFrame): The pandas DataFrame to be cleaned and validated.
-        schema (Schema): A `Schema` object that defines the validation and 
-            cleaning rules. It can be created from a `Schema` instance or a 
-            dictionary.
+        schema (Union[Schema, CompiledSchema]): A `Schema` object that defines the
+            validation and cleaning rules. It can be created from a `Schema` instance
+            or a dictionary. Pass the result of `Schema.compile()` to skip compiling
+            the schema again on every call.
+        max_workers (Optional[int]): The maximum number of threads used to validate
+            columns concurrently. Defaults to the number of CPUs. Threads are only used
+            for DataFrames with at least 50,000 rows and 4 column rules, and only when
+            pandas Copy-on-Write is available (pandas >= 2.0). Pass 1 to always
+            validate columns sequentially. When columns are validated concurrently,
+            each one sees the other columns' values as they were before cleaning.
+        enable_live_console (Optional[bool]): If True, each report message is also printed to
+            the console as it is logged; if False, nothing is printed. Defaults to None, which
+            follows an enclosing `reporting.live_console()` block and is otherwise off, since
+            rendering is slow on large runs; use `reporting.display_report` to show the
+            report afterwards.
+        early_drop (bool): If True, rows marked for removal by the null and regex checks
+            are dropped before the dtype conversion, constraints, custom validators and
+            unique checks run, so those only process the surviving rows. Those later
+            checks (and any side effects of custom validators or `resolve_duplicates`)
+            then see the shrunken frame: e.g. a value whose first occurrence was dropped
+            early is no longer a duplicate. Report messages are grouped by column within
+            each of the two phases.
 
     Returns:
         Tuple[pd.DataFrame, list[str]]: A tuple containing:
@@ -62,26 +100,161 @@ def clean_and_validate(df: pd.DataFrame, schema: Schema) -> Tuple[pd.DataFrame,
         >>> # 'Replaced 1 value(s) in 'zip_code' failing regex with None.'
         >>> # 'Dropped 1 row(s) due to validation.'
     """
-    df_cleaned = df.copy()
-    rows_to_drop = pd.Series(False, index=df_cleaned.index)
-    report: list[str] = []
+    compiled = schema if isinstance(schema, CompiledSchema) else schema.compile()
+
+    # With Copy-on-Write only the columns we modify get copied. It has to stay on after we
+    # return (pandas >= 3, or enabled by the caller); otherwise the result would share the
+    # untouched columns' buffers with `df` once the `copy_on_write` block below exits
+    shallow = copy_on_write_enabled()
+    console = live_console(enable_live_console) if enable_live_console is not None else nullcontext()
+    with copy_on_write(), console:
+        df_cleaned = df.copy(deep=False) if shallow else df.copy()
+        report: list[str] = []
+
+        # 1. Validate DataFrame-level rules, which may refer to the caller's index
+        if compiled.dataframe_rule:
+            df_cleaned = validate_dataframe(df_cleaned, compiled.dataframe_rule, report)
+
+        # The result gets a fresh RangeIndex anyway; validating the columns on one keeps label
+        # lookups (e.g. the rows kept by `resolve_duplicates`) cheap for MultiIndex or string indexes
+        df_cleaned.index = pd.RangeIndex(len(df_cleaned))
+
+        # 2. Validate columns
+        n_dropped = 0
+        if early_drop:
+            # Drop the rows failing the cheap checks before running the expensive ones
+            rows_to_drop = np.zeros(len(df_cleaned), dtype=bool)
+            _run_columns(df_cleaned, compiled, report, rows_to_drop, max_workers, EARLY_DROP_STAGES)
+            if rows_to_drop.any():
+                n_dropped = np.count_nonzero(rows_to_drop)
+                df_cleaned = df_cleaned.take(np.flatnonzero(~rows_to_drop))
+        rows_to_drop = np.zeros(len(df_cleaned), dtype=bool)
+        _run_columns(df_cleaned, compiled, report, rows_to_drop, max_workers, LATE_STAGES if early_drop else None)
+
+        # 3. Drop invalid rows
+        if n_dropped or rows_to_drop.any():
+            n_dropped += np.count_nonzero(rows_to_drop)
+            log_info(f"Dropping {n_dropped} row(s) due to validation.", report)
+            df_cleaned = df_cleaned.take(np.flatnonzero(~rows_to_drop))
+
+        # 4. Apply casts deferred until after the drop, so discarded rows are never converted
+        for col, rule in compiled.deferred_conversions:
+            if col in df_cleaned.columns:
+                df_cleaned = finalize_conversion(df_cleaned, col, rule, report)
+
+        df_cleaned.index = pd.RangeIndex(len(df_cleaned))
+        return df_cleaned, report
+
+
+def _run_columns(df: pd.DataFrame, compiled: CompiledSchema, report: list[str], rows_to_drop: np.ndarray, max_workers: Optional[int], stages: Optional[Sequence] = None):
+    """Runs the column steps of `compiled`, across threads when the DataFrame is large enough."""
+    steps = compiled.steps
+    n_present = sum(step.column in df.columns for step in steps)
+    if max_workers != 1 and n_present >= _PARALLEL_MIN_COLUMNS and len(df) >= _PARALLEL_MIN_ROWS:
+        run_column_steps_parallel(df, steps, report, rows_to_drop, max_workers, stages)
+    else:
+        run_column_steps(df, steps, report, rows_to_drop, stages)
+
+
+def _iter_batches(source: Union[str, os.PathLike, pd.DataFrame], batch_size: int, text_columns: Optional[list] = None) -> Iterator[pd.DataFrame]:
+    """Yields consecutive row batches from a DataFrame or a CSV file.
+
+    Columns in `text_columns` are read from a CSV file as strings rather than letting pandas
+    infer their type per batch, which would e.g. turn the zip code `01234` into `1234`.
+    """
+    if isinstance(source, pd.DataFrame):
+        # An empty DataFrame still yields one (empty) batch, like a CSV file with only a header
+        for start in range(0, max(len(source), 1), batch_size):
+            yield source.iloc[start:start + batch_size]
+    else:
+        dtypes = {col: str for col in text_columns or []}
+        with pd.read_csv(source, chunksize=batch_size, dtype=dtypes or None) as reader:
+            yield from reader
+
 
-    # 1. Validate DataFrame-level rules
-    if schema.dataframe_rule:
-        df_cleaned = validate_dataframe(df_cleaned, schema.dataframe_rule, report)
+def iter_clean_and_validate(
+    source: Union[str, os.PathLike, pd.DataFrame],
+    schema: Union[Schema, CompiledSchema],
+    batch_size: int = 65536,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[pd.DataFrame, list[str]]]:
+    """Cleans and validates a CSV file or DataFrame batch by batch.
+
+    Each batch of at most `batch_size` rows is passed through `clean_and_validate`,
+    so peak memory is bounded by the batch size rather than the size of the input.
+    This makes it possible to validate files that do not fit in memory, provided each
+    cleaned batch is consumed (e.g. written out) before the next one is requested.
+
+    Note that DataFrame-level rules (row counts, duplicates, cross-validations) and
+    column `unique` constraints are evaluated within each batch, not across batches.
+
+    Args:
+        source (Union[str, os.PathLike, pd.DataFrame]): A path to a CSV file, or a DataFrame.
+        schema (Union[Schema, CompiledSchema]): The `Schema` to validate each batch against.
+            It is compiled once and reused for every batch.
+        batch_size (int): The maximum number of rows per batch.
+        max_workers (Optional[int]): Passed through to `clean_and_validate`.
+
+    Yields:
+        Tuple[pd.DataFrame, list[str]]: The cleaned batch and its report.
+
+    Example:
+        >>> batches = iter_clean_and_validate("sales.csv", schema)
+        >>> for i, (cleaned_batch, batch_report) in enumerate(batches):
+        ...     cleaned_batch.to_csv("sales_clean.csv", mode="a", index=False, header=(i == 0))
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}.")
+    compiled = schema if isinstance(schema, CompiledSchema) else schema.compile()
+    text_columns = [col for col, rule in compiled.schema.rules.items() if rule.dtype in _TEXT_DTYPES]
+    for batch in _iter_batches(source, batch_size, text_columns):
+        yield clean_and_validate(batch, compiled, max_workers=max_workers)
+
+
+def clean_and_validate_streaming(
+    source: Union[str, os.PathLike, pd.DataFrame],
+    schema: Union[Schema, CompiledSchema],
+    batch_size: int = 65536,
+    max_workers: Optional[int] = None,
+) -> Tuple[pd.DataFrame, list[str]]:
+    """Cleans and validates a CSV file or DataFrame in batches and combines the results.
+
+    The input is read one batch at a time, but every cleaned batch is kept and the batches
+    are concatenated at the end, so peak memory is about twice the size of the cleaned
+    output. To keep memory bounded by the batch size, consume the batches of
+    `iter_clean_and_validate` as they are produced instead. See `iter_clean_and_validate`
+    for how rules are applied per batch.
+
+    Args:
+        source (Union[str, os.PathLike, pd.DataFrame]): A path to a CSV file, or a DataFrame.
+        schema (Union[Schema, CompiledSchema]): The `Schema` to validate each batch against.
+        batch_size (int): The maximum number of rows per batch.
+        max_workers (Optional[int]): Passed through to `clean_and_validate`.
+
+    Returns:
+        Tuple[pd.DataFrame, list[str]]: The concatenated cleaned DataFrame and the reports
+            of all batches, in order.
+    """
+    batches: list[pd.DataFrame] = []
+    report: list[str] = []
+    for cleaned_batch, batch_report in iter_clean_and_validate(source, schema, batch_size, max_workers):
+        batches.append(cleaned_batch)
+        report.extend(batch_report)
 
-    # 2. Validate columns
-    for col, rule in schema.rules.items():
-        if col not in df_cleaned.columns:
-            log_warning(f"Column '{col}' is missing from DataFrame.", report)
-            continue
+    if not batches:
+        return pd.DataFrame(), report
 
-        df_cleaned, updated_rows_to_drop = validate_column(df_cleaned, col, rule, report)
-        rows_to_drop |= updated_rows_to_drop
+    df_cleaned = pd.concat(batches, ignore_index=True)
 
-    # 3. Drop invalid rows
-    if rows_to_drop.sum():
-        log_info(f"Dropping {rows_to_drop.sum()} row(s) due to validation.", report)
-        df_cleaned = df_cleaned[~rows_to_drop]
+    # Batches may end up with different categories, which concat widens to object
+    rules = schema.schema.rules if isinstance(schema, CompiledSchema) else schema.rules
+    for col, rule in rules.items():
+        if rule.dtype == "category" and col in df_cleaned.columns:
+            if rule.allowed_values:
+                allowed = allowed_values_index(rule)
+                df_cleaned[col] = pd.Categorical(df_cleaned[col], categories=allowed)
+                df_cleaned[col] = df_cleaned[col].cat.remove_unused_categories()
+            else:
+                df_cleaned[col] = df_cleaned[col].astype("category")
 
-    return df_cleaned.reset_index(drop=True), report
+    return df_cleaned, report
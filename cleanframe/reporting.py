@@ -1,4 +1,6 @@
-from typing import List
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List
 import logging
 from rich.console import Console
 from rich.table import Table
@@ -6,26 +8,46 @@ from rich.table import Table
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Live console output is opt-in: rendering each message with Rich is slow on large runs.
+# A context variable keeps concurrent calls (threads, async tasks) from toggling each other's output.
+_live_console: ContextVar[bool] = ContextVar("live_console", default=False)
+
+
+@contextmanager
+def live_console(enabled: bool = True) -> Iterator[None]:
+    """Echoes log messages to the Rich console while the block runs."""
+    token = _live_console.set(enabled)
+    try:
+        yield
+    finally:
+        _live_console.reset(token)
+
+
+def _console_log(msg: str, style: str):
+    """Prints a message to the console if live output is enabled."""
+    if _live_console.get():
+        console.log(f"[{style}]{msg}")
+
 
 def log_info(msg: str, report: List[str]):
-    """Logs an informational message to the logger, report list, and console."""
+    """Logs an informational message to the logger, report list, and (if live) console."""
     logger.info(msg)
     report.append(msg)
-    console.log(f"[green]{msg}")
+    _console_log(msg, "green")
 
 
 def log_warning(msg: str, report: List[str]):
-    """Logs a warning message to the logger, report list, and console."""
+    """Logs a warning message to the logger, report list, and (if live) console."""
     logger.warning(msg)
     report.append(msg)
-    console.log(f"[yellow]{msg}")
+    _console_log(msg, "yellow")
 
 
 def log_error(msg: str, report: List[str]):
-    """Logs an error message to the logger, report list, and console."""
+    """Logs an error message to the logger, report list, and (if live) console."""
     logger.error(msg)
     report.append(msg)
-    console.log(f"[red]{msg}")
+    _console_log(msg, "red")
 
 
 def display_report(report: List[str]):
@@ -52,7 +74,7 @@ def log_duplicates_removed(column: str, removed_count: int, report: List[str]):
     message = f"Marked {removed_count} duplicate row(s) in column '{column}' for removal, keeping only unique entries."
     logger.info(message)
     report.append(message)
-    console.log(f"[yellow]{message}")
+    _console_log(message, "yellow")
 
 
 def log_regex_invalid(column: str, count: int, report: List[str]):
@@ -60,4 +82,4 @@ def log_regex_invalid(column: str, count: int, report: List[str]):
     message = f"{count} value(s) in column '{column}' failed regex validation."
     logger.warning(message)
     report.append(message)
-    console.log(f"[yellow]{message}")
\ No newline at end of file
+    _console_log(message, "yellow")
\ No newline at end of file
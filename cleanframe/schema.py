@@ -1,5 +1,6 @@
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, NamedTuple, Optional, Pattern, Union
 from dataclasses import dataclass, field
+import pandas as pd
 from .schema_validator import SchemaValidator, SchemaValidationError
 
 
@@ -18,13 +19,27 @@ class ColumnRule:
         min (Optional[Union[int, float]]): The minimum allowed value for a numeric or date column.
         max (Optional[Union[int, float]]): The maximum allowed value for a numeric or date column.
         allowed_values (Optional[List[Any]]): A list of specific values that are permitted in the column.
+            For `dtype='category'` columns, the categories are restricted to these values; columns
+            of other dtypes keep their dtype.
         regex (Optional[str]): A regular expression pattern for string validation.
         custom_validator (Optional[Callable[[Any, Dict[str, Any]], bool]]): A custom validation function
             that takes a value and the row dictionary, returning True for a valid value.
+        custom_validator_vectorized (Optional[Callable[[pd.Series], pd.Series]]): A vectorized variant of
+            `custom_validator` that receives the whole column and returns a boolean Series or array,
+            True for valid values. Takes precedence over `custom_validator` when both are set.
         unique (bool): If True, ensures all values in the column are unique. Duplicates are handled
             by `resolve_duplicates`.
         resolve_duplicates (Optional[Callable[[Any], Any]]): A custom function to handle duplicate
             values. It receives a DataFrame slice of duplicates and returns the row to keep.
+            It is called once per group of equal values, with the group's rows in their
+            original order, and may return a DataFrame or a single row as a Series. Groups are
+            passed as plain slices rather than through `groupby().apply()`; a function that
+            relies on groupby behaviour (e.g. `DataFrameGroupBy.apply` reassembling its results)
+            can opt back in by setting a `requires_groupby = True` attribute on itself:
+
+                def keep_latest(group):
+                    return group.nlargest(1, "updated_at")
+                keep_latest.requires_groupby = True
     """
     dtype: Optional[str] = None
     allow_null: bool = True
@@ -35,8 +50,48 @@ class ColumnRule:
     allowed_values: Optional[List[Any]] = None
     regex: Optional[str] = None  # NEW: regex validation for string values
     custom_validator: Optional[Callable[[Any, Dict[str, Any]], bool]] = None
+    custom_validator_vectorized: Optional[Callable[[pd.Series], pd.Series]] = None
     unique: bool = False
     resolve_duplicates: Optional[Callable[[Any], Any]] = None
+    _compiled_regex: Optional[Pattern] = field(default=None, init=False, repr=False, compare=False)
+    _allowed_index: Optional[pd.Index] = field(default=None, init=False, repr=False, compare=False)
+    _allowed_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+
+# Cross-validation kinds and actions, resolved once per `cross_validations` list
+CHECK_COMPARISON, CHECK_AGGREGATE, CHECK_CONDITIONAL = 0, 1, 2
+ACTION_WARN, ACTION_DROP = 0, 1
+_CHECK_KINDS = {"comparison": CHECK_COMPARISON, "aggregate": CHECK_AGGREGATE, "conditional": CHECK_CONDITIONAL}
+# The keys holding each kind's expressions, in order
+CHECK_KEYS = {CHECK_COMPARISON: ("condition",), CHECK_AGGREGATE: ("check",), CHECK_CONDITIONAL: ("if", "then")}
+
+
+class CrossValidation(NamedTuple):
+    """A `cross_validations` entry normalized for fast dispatch.
+
+    Attributes:
+        kind (Optional[int]): One of the `CHECK_*` codes, or None for unknown types (which are ignored).
+        action (int): `ACTION_DROP` if the check's action is "drop", otherwise `ACTION_WARN`.
+        exprs (tuple): The check's expressions, per `CHECK_KEYS`. Missing keys are None.
+        source (Dict[str, Any]): The original dictionary, used in report messages.
+        error (Optional[Exception]): The error raised while normalizing a malformed entry, which
+            is reported when the check runs.
+    """
+    kind: Optional[int]
+    action: int
+    exprs: tuple
+    source: Dict[str, Any]
+    error: Optional[Exception] = None
+
+    @classmethod
+    def from_dict(cls, check: Dict[str, Any]) -> "CrossValidation":
+        try:
+            kind = _CHECK_KINDS.get(check.get("type"))
+            action = ACTION_DROP if check.get("action", "warn") == "drop" else ACTION_WARN
+            exprs = tuple(check.get(key) for key in CHECK_KEYS[kind]) if kind is not None else ()
+        except Exception as e:
+            return cls(None, ACTION_WARN, (), check, e)
+        return cls(kind, action, exprs, check)
 
 
 @dataclass
@@ -50,7 +105,8 @@ class DataFrameRule:
         unique_keys (Optional[List[str]]): A list of column names that, when combined, must be unique.
         expected_columns (Optional[List[str]]): A list of columns that are expected to be present.
         cross_validations (Optional[List[Dict[str, Any]]]): A list of dictionaries defining cross-column
-            validation rules using pandas' `query` and `eval` syntax.
+            validation rules using pandas' `query` and `eval` syntax. Conditions and `check` expressions are
+            evaluated as code, so they must come from a trusted source.
 
     Example of `cross_validations` dictionary:
     [
@@ -71,6 +127,10 @@ class DataFrameRule:
     #   {"type": "aggregate", "check": "df['sales'].sum() > 0"},
     #   {"type": "conditional", "if": "country == 'US'", "then": "state.notnull()"}
     # ]
+    _expected_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _expected_set: FrozenSet[str] = field(default=frozenset(), init=False, repr=False, compare=False)
+    _checks: List[CrossValidation] = field(default_factory=list, init=False, repr=False, compare=False)
+    _checks_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
 
 
 @dataclass
@@ -125,6 +185,28 @@ class Schema:
         """
         self.rules[column_name] = rule
 
+    def compile(self) -> "CompiledSchema":
+        """Specializes the schema into a flat list of column validation steps.
+
+        Each step only contains the checks its rule actually uses, so repeated calls to
+        `clean_and_validate` with the compiled schema skip re-inspecting every rule.
+        Compile again after modifying the schema or its rules.
+
+        Returns:
+            CompiledSchema: The compiled schema, accepted anywhere a `Schema` is.
+
+        Example:
+            >>> compiled = my_schema.compile()
+            >>> for batch in batches:
+            ...     cleaned_batch, report = clean_and_validate(batch, compiled)
+        """
+        from .transformers import can_defer_conversion
+        from .validators import compile_column
+
+        steps = [compile_column(col, rule, defer_conversion=True) for col, rule in self.rules.items()]
+        deferred = [(col, rule) for col, rule in self.rules.items() if can_defer_conversion(rule)]
+        return CompiledSchema(schema=self, steps=steps, deferred_conversions=deferred)
+
     def get(self, column_name: str) -> Optional[ColumnRule]:
         """Retrieves a `ColumnRule` by its column name.
 
@@ -135,3 +217,37 @@ class Schema:
             Optional[ColumnRule]: The `ColumnRule` instance or None if not found.
         """
         return self.rules.get(column_name)
+
+
+class ColumnStep(NamedTuple):
+    """A compiled validation step for a single column.
+
+    Attributes:
+        column (str): The name of the column the step validates.
+        rule (ColumnRule): The rule the step was compiled from.
+        stages (List[Callable]): The validation stages the rule needs, in order (see
+            `validators.column_stages`). Run them with `validators.run_column_steps`.
+    """
+    column: str
+    rule: ColumnRule
+    stages: List[Callable]
+
+
+@dataclass
+class CompiledSchema:
+    """A `Schema` specialized into column validation steps, created by `Schema.compile()`.
+
+    Attributes:
+        schema (Schema): The schema this was compiled from.
+        steps (List[ColumnStep]): One step per column rule, in schema order.
+        deferred_conversions (List[tuple]): `(column, rule)` pairs whose type conversion
+            is applied after invalid rows are dropped.
+    """
+    schema: Schema
+    steps: List[ColumnStep]
+    deferred_conversions: List[tuple]
+
+    @property
+    def dataframe_rule(self) -> Optional[DataFrameRule]:
+        """The DataFrame-level rules of the underlying schema."""
+        return self.schema.dataframe_rule
@@ -1,100 +1,250 @@
+import numpy as np
 import pandas as pd
 from .schema import ColumnRule
 from .reporting import log_info, log_warning, log_error
+from typing import Optional
+from .utils import ColumnContext, as_bool_array
 
-def convert_dtype(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str]) -> tuple[pd.DataFrame, pd.Series]:
+try:
+    import numexpr
+except ImportError:  # optional: speeds up range checks on large numeric columns
+    numexpr = None
+
+# Fused range check, evaluated by numexpr in a single pass (it caches the compiled expression)
+_OUT_OF_RANGE_EXPR = "(x < lo) | (x > hi)"
+
+# Conversions that coerce failures to NaN; later stages compare against their typed values
+COERCING_DTYPES = {"int", "float", "datetime"}
+
+def _is_real_number(value) -> bool:
+    """Returns True for int/float scalars that can be written into a numeric numpy array."""
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+def allowed_values_index(rule: ColumnRule) -> pd.Index:
+    """Returns `rule.allowed_values` as an index for membership checks, rebuilding it only when they change."""
+    key = tuple(rule.allowed_values)
+    if rule._allowed_index is None or rule._allowed_key != key:
+        rule._allowed_index = pd.Index(rule.allowed_values)
+        rule._allowed_key = key
+    return rule._allowed_index
+
+def _has_target_dtype(series: pd.Series, dtype: str) -> bool:
+    """Returns True if converting the series to `dtype` would leave it unchanged."""
+    current = series.dtype
+    if dtype in ('int', 'float'):
+        return pd.api.types.is_numeric_dtype(current) and not pd.api.types.is_bool_dtype(current)
+    if dtype == 'datetime':
+        return pd.api.types.is_datetime64_any_dtype(current)
+    if dtype == 'category':
+        return isinstance(current, pd.CategoricalDtype)
+    try:
+        return current == pd.api.types.pandas_dtype(dtype)
+    except TypeError:
+        return False
+
+def convert_dtype(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str], ctx: Optional[ColumnContext] = None, rows_to_drop: Optional[np.ndarray] = None) -> tuple[pd.DataFrame, np.ndarray]:
     """Converts a column's data type and handles values that fail conversion.
 
     This function attempts to cast a column to the `dtype` specified in the rule.
     It uses pandas' robust type conversion functions (`to_numeric`, `to_datetime`)
-    to handle non-coercible values.
+    to handle non-coercible values. Columns that already have the target dtype are
+    returned as they are, without allocating a converted copy.
 
     Args:
         df (pd.DataFrame): The DataFrame containing the column to be converted.
         col (str): The name of the column to convert.
         rule (ColumnRule): The rule object containing the `dtype` definition.
         report (list[str]): The list to append conversion log messages to.
+        ctx (Optional[ColumnContext]): Shared column state from `validate_column`. Built from
+            the column if not given.
+        rows_to_drop (Optional[np.ndarray]): A boolean array to mark rows for removal in place,
+            e.g. the mask shared by all stages of `validate_column`. Allocated if not given.
 
     Returns:
-        Tuple[pd.DataFrame, pd.Series]: A tuple containing:
+        Tuple[pd.DataFrame, np.ndarray]: A tuple containing:
             - The DataFrame with the column converted to the new data type.
-            - A boolean Series indicating which rows failed conversion and are
+            - A boolean array indicating which rows failed conversion and are
               marked for removal.
     """
-    rows_to_drop = pd.Series(False, index=df.index)
+    if rows_to_drop is None:
+        rows_to_drop = np.zeros(len(df), dtype=bool)
 
     if rule.dtype:
+        if ctx is None:
+            ctx = ColumnContext.from_series(df[col])
+        # Columns read with the right dtype (e.g. by read_csv inference) need no conversion
+        if _has_target_dtype(ctx.series, rule.dtype):
+            return df, rows_to_drop
         try:
             if rule.dtype == 'datetime':
-                converted = pd.to_datetime(df[col], errors='coerce')
+                converted = pd.to_datetime(ctx.series, errors='coerce')
             elif rule.dtype in ['int', 'float']:
-                converted = pd.to_numeric(df[col], errors='coerce')
+                converted = pd.to_numeric(ctx.series, errors='coerce')
             else:
-                converted = df[col].astype(rule.dtype)
+                converted = ctx.series.astype(rule.dtype)
 
-            invalid_type = converted.isnull() & df[col].notnull()
-            if invalid_type.sum():
+            converted_null = as_bool_array(converted.isna())
+            invalid_type = converted_null & ctx.notnull_mask
+            if invalid_type.any():
+                n_invalid = np.count_nonzero(invalid_type)
                 if rule.drop_if_invalid:
-                    rows_to_drop |= invalid_type
-                    log_warning(f"{invalid_type.sum()} invalid type(s) in '{col}' marked for drop.", report)
+                    np.logical_or(rows_to_drop, invalid_type, out=rows_to_drop)
+                    log_warning(f"{n_invalid} invalid type(s) in '{col}' marked for drop.", report)
                 else:
-                    log_info(f"{invalid_type.sum()} value(s) in '{col}' coerced to NaN.", report)
+                    log_info(f"{n_invalid} value(s) in '{col}' coerced to NaN.", report)
             df[col] = converted
+            ctx.update(df[col], converted_null)
         except Exception as e:
             log_error(f"Failed type conversion for column '{col}': {e}", report)
 
     return df, rows_to_drop
 
-def apply_constraints(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str]) -> tuple[pd.DataFrame, pd.Series]:
+def can_defer_conversion(rule: ColumnRule) -> bool:
+    """Returns True if the column's type conversion can run after invalid rows are dropped.
+
+    This holds for plain casts (e.g. 'string', 'category') that cannot flag rows as invalid,
+    as long as no later stage of `validate_column` depends on the typed values.
+    """
+    return (
+        bool(rule.dtype)
+        and rule.dtype not in COERCING_DTYPES
+        and rule.min is None
+        and rule.max is None
+        and not rule.allowed_values
+        and not rule.custom_validator
+        and not rule.custom_validator_vectorized
+        and not rule.unique
+    )
+
+def finalize_conversion(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str]) -> pd.DataFrame:
+    """Applies a type conversion deferred by `validate_column(..., defer_conversion=True)`.
+
+    Call this after invalid rows have been dropped, so the cast only touches surviving rows.
+
+    Args:
+        df (pd.DataFrame): The DataFrame containing the column to be converted.
+        col (str): The name of the column to convert.
+        rule (ColumnRule): The rule object containing the `dtype` definition.
+        report (list[str]): The list to append conversion log messages to.
+
+    Returns:
+        pd.DataFrame: The DataFrame with the column converted to the new data type.
+    """
+    df, _ = convert_dtype(df, col, rule, report)
+    return df
+
+def apply_constraints(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str], ctx: Optional[ColumnContext] = None, rows_to_drop: Optional[np.ndarray] = None) -> tuple[pd.DataFrame, np.ndarray]:
     """Applies `min`, `max`, and `allowed_values` constraints to a column.
 
     This function checks a column's values against the defined constraints.
     It either replaces invalid values with `fillna` or marks the corresponding
     rows for removal based on the `drop_if_invalid` rule.
 
+    Values outside `min`/`max` are replaced with the bound itself. An int column stays int
+    unless a bound with a fractional part is written into it, which makes it float64.
+
     Args:
         df (pd.DataFrame): The DataFrame containing the column to check.
         col (str): The name of the column.
         rule (ColumnRule): The rule object containing the constraints.
         report (list[str]): The list to append validation log messages to.
+        ctx (Optional[ColumnContext]): Shared column state from `validate_column`. Built from
+            the column if not given.
+        rows_to_drop (Optional[np.ndarray]): A boolean array to mark rows for removal in place,
+            e.g. the mask shared by all stages of `validate_column`. Allocated if not given.
 
     Returns:
-        Tuple[pd.DataFrame, pd.Series]: A tuple containing:
+        Tuple[pd.DataFrame, np.ndarray]: A tuple containing:
             - The DataFrame with any in-place cleaning applied.
-            - A boolean Series indicating which rows are marked for removal.
+            - A boolean array indicating which rows are marked for removal.
     """
-    rows_to_drop = pd.Series(False, index=df.index)
+    if rows_to_drop is None:
+        rows_to_drop = np.zeros(len(df), dtype=bool)
+    if ctx is None and (rule.min is not None or rule.max is not None or rule.allowed_values):
+        ctx = ColumnContext.from_series(df[col])
 
-    if rule.min is not None:
-        below_min = df[col] < rule.min
-        if below_min.sum():
-            if rule.drop_if_invalid:
-                rows_to_drop |= below_min
-                log_warning(f"{below_min.sum()} value(s) in '{col}' below min marked for drop.", report)
-            else:
-                df.loc[below_min, col] = rule.min
-                log_info(f"Replaced {below_min.sum()} value(s) in '{col}' below min with {rule.min}.", report)
+    if rule.min is not None or rule.max is not None:
+        # Compare on the raw ndarray for plain numpy dtypes; nullable/object columns go through pandas
+        arr = ctx.arr
+        # Nullable dtypes like Int64 also expose a numpy array, but writing one back would drop the mask
+        vectorized = isinstance(ctx.series.dtype, np.dtype) and arr.dtype.kind in "iuf"
+        # Out-of-range replacements are collected and written back to the column in one pass
+        fill_conditions, fill_values = [], []
 
-    if rule.max is not None:
-        above_max = df[col] > rule.max
-        if above_max.sum():
-            if rule.drop_if_invalid:
-                rows_to_drop |= above_max
-                log_warning(f"{above_max.sum()} value(s) in '{col}' above max marked for drop.", report)
+        if (numexpr is not None and arr.dtype.kind in "if" and rule.drop_if_invalid
+                and rule.min is not None and rule.max is not None):
+            out_of_range = numexpr.evaluate(_OUT_OF_RANGE_EXPR, local_dict={"x": arr, "lo": rule.min, "hi": rule.max})
+            if out_of_range.any():
+                np.logical_or(rows_to_drop, out_of_range, out=rows_to_drop)
+                # Split the count for the report using only the offending values
+                n_below = np.count_nonzero(arr[out_of_range] < rule.min)
+                n_above = np.count_nonzero(out_of_range) - n_below
+                if n_below:
+                    log_warning(f"{n_below} value(s) in '{col}' below min marked for drop.", report)
+                if n_above:
+                    log_warning(f"{n_above} value(s) in '{col}' above max marked for drop.", report)
+        else:
+            if rule.min is not None:
+                below_min = arr < rule.min if vectorized else as_bool_array(ctx.series < rule.min)
+                if below_min.any():
+                    n_below = np.count_nonzero(below_min)
+                    if rule.drop_if_invalid:
+                        np.logical_or(rows_to_drop, below_min, out=rows_to_drop)
+                        log_warning(f"{n_below} value(s) in '{col}' below min marked for drop.", report)
+                    else:
+                        fill_conditions.append(below_min)
+                        fill_values.append(rule.min)
+                        log_info(f"Replaced {n_below} value(s) in '{col}' below min with {rule.min}.", report)
+
+            if rule.max is not None:
+                above_max = arr > rule.max if vectorized else as_bool_array(ctx.series > rule.max)
+                if above_max.any():
+                    n_above = np.count_nonzero(above_max)
+                    if rule.drop_if_invalid:
+                        np.logical_or(rows_to_drop, above_max, out=rows_to_drop)
+                        log_warning(f"{n_above} value(s) in '{col}' above max marked for drop.", report)
+                    else:
+                        fill_conditions.append(above_max)
+                        fill_values.append(rule.max)
+                        log_info(f"Replaced {n_above} value(s) in '{col}' above max with {rule.max}.", report)
+
+        if fill_conditions:
+            if vectorized:
+                filled = np.select(fill_conditions, fill_values, default=arr)
+                # Float bounds upcast int columns; keep the int dtype when they are whole numbers.
+                # A fractional bound (e.g. `min=0.5`) written into an int column makes it float64.
+                if filled.dtype != arr.dtype and arr.dtype.kind in "iu" and all(float(v).is_integer() for v in fill_values):
+                    filled = filled.astype(arr.dtype)
+                df[col] = filled
+                ctx.update(df[col], ctx.null_mask)
             else:
-                df.loc[above_max, col] = rule.max
-                log_info(f"Replaced {above_max.sum()} value(s) in '{col}' above max with {rule.max}.", report)
+                for condition, value in zip(fill_conditions, fill_values):
+                    ctx.fill(df, col, condition, value)
 
     if rule.allowed_values:
-        not_allowed = ~df[col].isin(rule.allowed_values)
-        if not_allowed.sum():
+        allowed = allowed_values_index(rule)
+        not_allowed = ~as_bool_array(ctx.series.isin(allowed))
+        if not_allowed.any():
+            n_not_allowed = np.count_nonzero(not_allowed)
             if rule.drop_if_invalid:
-                rows_to_drop |= not_allowed
-                log_warning(f"{not_allowed.sum()} disallowed value(s) in '{col}' marked for drop.", report)
+                np.logical_or(rows_to_drop, not_allowed, out=rows_to_drop)
+                log_warning(f"{n_not_allowed} disallowed value(s) in '{col}' marked for drop.", report)
             else:
-                df.loc[not_allowed, col] = rule.fillna
-                log_info(f"Replaced {not_allowed.sum()} disallowed value(s) in '{col}' with {rule.fillna}.", report)
-        df[col] = pd.Categorical(df[col], categories=rule.allowed_values)
-        df[col] = df[col].cat.remove_unused_categories()
+                arr = ctx.arr
+                if isinstance(ctx.series.dtype, np.dtype) and arr.dtype.kind in "iuf" and _is_real_number(rule.fillna):
+                    df[col] = np.where(not_allowed, rule.fillna, arr)
+                    ctx.record_fill(df[col], not_allowed, rule.fillna)
+                else:
+                    if (isinstance(df[col].dtype, pd.CategoricalDtype) and not pd.isna(rule.fillna)
+                            and rule.fillna not in df[col].cat.categories):
+                        # A categorical only accepts values among its categories
+                        df[col] = df[col].cat.add_categories([rule.fillna])
+                        ctx.update(df[col], ctx.null_mask)
+                    ctx.fill(df, col, not_allowed, rule.fillna)
+                log_info(f"Replaced {n_not_allowed} disallowed value(s) in '{col}' with {rule.fillna}.", report)
+        if rule.dtype == "category":
+            df[col] = pd.Categorical(df[col], categories=allowed)
+            df[col] = df[col].cat.remove_unused_categories()
+            ctx.update(df[col])
 
     return df, rows_to_drop
\ No newline at end of file
@@ -1,8 +1,159 @@
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+import numpy as np
 import pandas as pd
 from .schema import ColumnRule
 from .reporting import log_info, log_warning, log_error
 
-def apply_custom_validator(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str]) -> tuple[pd.DataFrame, pd.Series]:
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow strings live in one contiguous buffer and run predicates in C++ (pandas >= 1.3)
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+except (ImportError, TypeError):  # optional: speeds up regex checks on large string columns
+    STRING_DTYPE = "string"
+
+
+@contextmanager
+def copy_on_write() -> Iterator[bool]:
+    """Enables pandas Copy-on-Write for the duration of the block, where supported.
+
+    Yields:
+        bool: True if Copy-on-Write is active, in which case shallow copies are safe to
+            modify without affecting the original DataFrame. False on pandas < 2.0.
+    """
+    if _PANDAS_MAJOR >= 3:
+        # Always enabled; setting the option is deprecated
+        yield True
+    elif _PANDAS_MAJOR == 2:
+        with pd.option_context("mode.copy_on_write", True):
+            yield True
+    else:
+        yield False
+
+
+def copy_on_write_enabled() -> bool:
+    """Returns True if pandas Copy-on-Write is currently active."""
+    if _PANDAS_MAJOR >= 3:
+        return True
+    if _PANDAS_MAJOR == 2:
+        return pd.get_option("mode.copy_on_write") is True
+    return False
+
+
+@contextmanager
+def positional_index(df: pd.DataFrame) -> Iterator[pd.Index]:
+    """Gives `df` a RangeIndex for the duration of the block, then restores its own index.
+
+    Row labels then match positions, so label lookups (e.g. of the rows kept by
+    `resolve_duplicates`) never hash a MultiIndex or a large object index.
+
+    Yields:
+        pd.Index: The original index of `df`.
+    """
+    orig_index = df.index
+    if isinstance(orig_index, pd.RangeIndex):
+        yield orig_index
+        return
+    df.index = pd.RangeIndex(len(df))
+    try:
+        yield orig_index
+    finally:
+        df.index = orig_index
+
+
+def as_bool_array(values) -> np.ndarray:
+    """Converts a boolean Series or array-like to a plain ndarray, treating missing values as False."""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype=bool, na_value=False)
+    return np.asarray(values, dtype=bool)
+
+
+def _can_hold(dtype, value: Any) -> bool:
+    """Returns True if `value` can be written into an array of `dtype` without upcasting it."""
+    if np.ndim(value) != 0 or value is None:
+        return False
+    if isinstance(dtype, pd.StringDtype):
+        return isinstance(value, str)
+    if not isinstance(dtype, np.dtype):
+        return False
+    if dtype.kind == "O":
+        return True
+    if dtype.kind == "b":
+        return isinstance(value, (bool, np.bool_))
+    if isinstance(value, (bool, np.bool_)):
+        return False
+    if dtype.kind == "f":
+        return isinstance(value, (int, float, np.integer, np.floating))
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        return isinstance(value, (int, np.integer)) and info.min <= value <= info.max
+    return False
+
+
+@dataclass
+class ColumnContext:
+    """Per-column state shared by the stages of `validate_column`.
+
+    The null mask is computed once when the context is created. Stages that write to the
+    column update it incrementally instead of rescanning the column.
+
+    Attributes:
+        series (pd.Series): The column's current values.
+        null_mask (np.ndarray): Boolean array marking null values in `series`.
+        notnull_mask (np.ndarray): The negation of `null_mask`.
+    """
+    series: pd.Series
+    null_mask: np.ndarray
+    notnull_mask: np.ndarray
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "ColumnContext":
+        """Builds a context for `series`, scanning it for nulls once."""
+        null_mask = as_bool_array(series.isna())
+        return cls(series, null_mask, ~null_mask)
+
+    @property
+    def arr(self) -> np.ndarray:
+        """The column as a numpy array (a view for numpy-backed columns)."""
+        return self.series.to_numpy()
+
+    def update(self, series: pd.Series, null_mask: Optional[np.ndarray] = None):
+        """Records a rewritten column. The null mask is rescanned unless given."""
+        self.series = series
+        if null_mask is None:
+            null_mask = as_bool_array(series.isna())
+        self.null_mask = null_mask
+        self.notnull_mask = ~null_mask
+
+    def fill(self, df: pd.DataFrame, col: str, mask: np.ndarray, value: Any):
+        """Writes `value` into `df[col]` where `mask` is True and records the fill.
+
+        If the column's array can hold `value` as-is, it is written into a copy of the array
+        at the masked positions only. Otherwise this falls back to `df.loc`, which upcasts the
+        column as needed.
+        """
+        dtype = self.series.dtype
+        if _can_hold(dtype, value):
+            values = self.series.to_numpy(copy=True) if isinstance(dtype, np.dtype) else self.series.array.copy()
+            values[np.flatnonzero(mask)] = value
+            df[col] = pd.Series(values, index=df.index, dtype=dtype, copy=False)
+        else:
+            df.loc[mask, col] = value
+        self.record_fill(df[col], mask, value)
+
+    def record_fill(self, series: pd.Series, mask: np.ndarray, value: Any):
+        """Records that `value` was written into the column where `mask` is True."""
+        if value is None or (np.ndim(value) == 0 and pd.isna(value)):
+            null_mask = self.null_mask | mask
+        else:
+            null_mask = self.null_mask & ~mask
+        self.update(series, null_mask)
+
+
+def apply_custom_validator(df: pd.DataFrame, col: str, rule: ColumnRule, report: list[str], ctx: Optional[ColumnContext] = None, rows_to_drop: Optional[np.ndarray] = None) -> tuple[pd.DataFrame, np.ndarray]:
     """Applies a user-defined custom validation function to a DataFrame column.
 
     This function iterates through the specified column and uses the custom validator 
@@ -13,14 +164,21 @@ def apply_custom_validator(df: pd.DataFrame, col: str, rule: ColumnRule, report:
         col (str): The name of the column to validate.
         rule (ColumnRule): The rule object containing the custom validator function.
         report (list[str]): The list to append validation log messages to.
+        ctx (Optional[ColumnContext]): Shared column state from `validate_column`. Built from
+            the column if not given.
+        rows_to_drop (Optional[np.ndarray]): A boolean array to mark rows for removal in place,
+            e.g. the mask shared by all stages of `validate_column`. Allocated if not given.
 
     Returns:
-        Tuple[pd.DataFrame, pd.Series]: A tuple containing:
+        Tuple[pd.DataFrame, np.ndarray]: A tuple containing:
             - The DataFrame, potentially with invalid values replaced by `fillna`.
-            - A boolean Series indicating which rows failed validation and are marked for drop.
+            - A boolean array indicating which rows failed validation and are marked for drop.
 
     How it Works:
-        The function applies `rule.custom_validator` to each element of the column. The validator 
+        If `rule.custom_validator_vectorized` is set, it is called once with the whole column and
+        must return a boolean Series or array (`True` for valid values). This is much faster than the
+        scalar path, so prefer it for checks expressible as Series operations (e.g. `lambda s: s >= 0`).
+        Otherwise, `rule.custom_validator` is applied to each element of the column. The validator 
         function should accept a single value and return `True` for valid values and `False` for invalid ones.
         - If a value fails and `rule.drop_if_invalid` is `True`, the corresponding row is marked for dropping.
         - If a value fails and `rule.drop_if_invalid` is `False`, the value is replaced by `rule.fillna`.
@@ -50,19 +208,27 @@ def apply_custom_validator(df: pd.DataFrame, col: str, rule: ColumnRule, report:
         3    10
         5     7
     """
-    rows_to_drop = pd.Series(False, index=df.index)
+    if rows_to_drop is None:
+        rows_to_drop = np.zeros(len(df), dtype=bool)
 
-    if rule.custom_validator:
+    if rule.custom_validator_vectorized or rule.custom_validator:
+        if ctx is None:
+            ctx = ColumnContext.from_series(df[col])
         try:
-            invalid = ~df[col].apply(lambda row: rule.custom_validator(row))
-            if invalid.sum():
+            if rule.custom_validator_vectorized:
+                valid = as_bool_array(rule.custom_validator_vectorized(ctx.series))
+            else:
+                valid = as_bool_array(ctx.series.map(rule.custom_validator))
+            invalid = ~valid
+            if invalid.any():
+                n_invalid = np.count_nonzero(invalid)
                 if rule.drop_if_invalid:
-                    rows_to_drop |= invalid
-                    log_warning(f"{invalid.sum()} value(s) failed custom validation in '{col}' and were marked for drop.", report)
+                    np.logical_or(rows_to_drop, invalid, out=rows_to_drop)
+                    log_warning(f"{n_invalid} value(s) failed custom validation in '{col}' and were marked for drop.", report)
                 else:
-                    df.loc[invalid, col] = rule.fillna
-                    log_info(f"Replaced {invalid.sum()} invalid custom values in '{col}' with {rule.fillna}.", report)
+                    ctx.fill(df, col, invalid, rule.fillna)
+                    log_info(f"Replaced {n_invalid} invalid custom values in '{col}' with {rule.fillna}.", report)
         except Exception as e:
             log_error(f"Error applying custom validator to '{col}': {e}", report)
 
-    return df, rows_to_drop
\ No newline at end of file
+    return df, rows_to_drop
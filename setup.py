@@ -26,6 +26,9 @@ setup(
     install_requires=[
         'pandas>=1.0.0',
     ],
+    extras_require={
+        'performance': ['numexpr', 'pyarrow'],
+    },
 
 
 )
\ No newline at end of file
@@ -3,8 +3,8 @@ import numpy as np
 import pytest
 
 from cleanframe.schema import Schema
-from cleanframe.core import clean_and_validate
-from cleanframe.validators import validate_dataframe
+from cleanframe.core import clean_and_validate, clean_and_validate_streaming
+from cleanframe.validators import validate_column, validate_columns, validate_columns_parallel, validate_dataframe
 
 
 # --------------------------
@@ -137,6 +137,142 @@ def test_unique_constraint_marks_duplicates_for_drop():
     assert any("Marked" in m and "duplicate row(s) in column 'id'" in m for m in report)
 
 
+def test_unique_constraint_resolve_duplicates():
+    df = pd.DataFrame({
+        "id": [1, 2, 2, 3, 3, 3],
+        "val": [10, 21, 20, 30, 32, 31]
+    })
+
+    for resolver in (
+        lambda g: g.loc[g["val"].idxmax()],  # a single row, as a Series
+        lambda g: g.nlargest(1, "val"),      # a DataFrame
+    ):
+        schema = Schema(rules={"id": {"dtype": "int", "unique": True, "resolve_duplicates": resolver}})
+        cleaned, report = clean_and_validate(df, schema)
+
+        assert list(cleaned["id"]) == [1, 2, 3]
+        assert list(cleaned["val"]) == [10, 21, 32]
+        assert any("Marked 3 duplicate row(s) in column 'id'" in m for m in report)
+
+
+def test_resolve_duplicates_with_repeated_index_labels():
+    index = pd.MultiIndex.from_tuples([("a", 1), ("a", 1), ("b", 2), ("b", 2)])
+    df = pd.DataFrame({"id": [1, 1, 2, 2], "val": [10, 11, 20, 21]}, index=index)
+    schema = Schema(rules={
+        "id": {"dtype": "int", "unique": True, "resolve_duplicates": lambda g: g.nlargest(1, "val")},
+    })
+
+    cleaned, _ = clean_and_validate(df, schema)
+    assert list(cleaned["val"]) == [11, 21]
+
+    validated, drop_mask = validate_column(df.copy(), "id", schema.rules["id"], [])
+    assert validated.index.equals(index)
+    assert drop_mask.index.equals(index)
+    assert drop_mask.tolist() == [True, False, True, False]
+
+
+def test_modifying_the_result_leaves_the_input_unchanged():
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0]})
+    schema = Schema(rules={"a": {"dtype": "int"}, "b": {"dtype": "float"}})
+
+    cleaned, _ = clean_and_validate(df, schema)
+    cleaned.iloc[0, 0] = 99
+    cleaned.loc[1, "b"] = -1.0
+
+    assert df["a"].tolist() == [1, 2, 3]
+    assert df["b"].tolist() == [4.0, 5.0, 6.0]
+
+
+@pytest.mark.filterwarnings("ignore:Possible nested set:FutureWarning")
+def test_regex_matches_non_ascii_text_like_python_re(monkeypatch):
+    import re
+    from cleanframe import validators
+
+    values = pd.Series(["José", "Zoë", "١٢٣", "ab\n", "abc", "123", "aab", "ab", None], dtype="string")
+    patterns = (r"^\w+$", r"\d+", r"ab$", r"[a-z]+", r"^[[:digit:]]+", r"^a{,2}b", r"(?i)AB", r"[0-9]{2,}|a+b")
+    with_re2 = {regex: validators._regex_invalid_mask(values, re.compile(regex)).tolist() for regex in patterns}
+    monkeypatch.setattr(validators, "pc", None)
+    for regex in patterns:
+        pattern = re.compile(regex)
+        expected = [v is not pd.NA and pattern.match(v) is None for v in values]
+        assert validators._regex_invalid_mask(values, pattern).tolist() == expected, regex
+        assert with_re2[regex] == expected, regex
+
+    for regex in (r"^\w+$", r"ab$", r"é+", r"^[[:digit:]]+", r"^a{,2}b", r"(?i)ab", r"a++", r"[]a]"):
+        assert not validators._re2_matches_like_re(re.compile(regex)), regex
+    for regex in (r"[a-z]+\\d", r"^[A-Z]{2}-[0-9]{3,}", r"(?:ab|cd)+?x", r"x\.y"):
+        assert validators._re2_matches_like_re(re.compile(regex)), regex
+
+
+def test_allowed_values_only_make_category_columns_categorical():
+    df = pd.DataFrame({"level": [1, 2, 5], "grade": ["a", "b", "z"], "size": ["s", "m", "s"]})
+    schema = Schema(rules={
+        "level": {"dtype": "int", "allowed_values": [1, 2], "fillna": 1},
+        "grade": {"dtype": "string", "allowed_values": ["a", "b"], "fillna": "a"},
+        "size": {"dtype": "category", "allowed_values": ["s", "m", "l"]},
+    })
+
+    cleaned, _ = clean_and_validate(df, schema)
+
+    assert cleaned["level"].dtype == "int64"
+    assert cleaned["level"].tolist() == [1, 2, 1]
+    assert cleaned["grade"].dtype == "string"
+    assert cleaned["grade"].tolist() == ["a", "b", "a"]
+    assert isinstance(cleaned["size"].dtype, pd.CategoricalDtype)
+    assert list(cleaned["size"].cat.categories) == ["s", "m"]
+
+
+def test_allowed_values_changed_after_construction_are_applied():
+    df = pd.DataFrame({"grade": ["a", "b", "z"]})
+    schema = Schema(rules={"grade": {"dtype": "category", "allowed_values": ["a", "b"], "drop_if_invalid": True}})
+    cleaned, _ = clean_and_validate(df, schema)
+    assert cleaned["grade"].tolist() == ["a", "b"]
+
+    schema.rules["grade"].allowed_values = ["a", "b", "z"]
+    cleaned, _ = clean_and_validate(df, schema)
+    assert cleaned["grade"].tolist() == ["a", "b", "z"]
+
+    cleaned, _ = clean_and_validate_streaming(df, schema, batch_size=2)
+    assert cleaned["grade"].tolist() == ["a", "b", "z"]
+    assert list(cleaned["grade"].cat.categories) == ["a", "b", "z"]
+
+
+def test_min_max_fills_keep_int_dtype_for_whole_bounds():
+    df = pd.DataFrame({"qty": [1, 5, 200]})
+
+    schema = Schema(rules={"qty": {"dtype": "int", "min": 0.0, "max": 100.0}})
+    cleaned, report = clean_and_validate(df, schema)
+    assert cleaned["qty"].dtype == "int64"
+    assert cleaned["qty"].tolist() == [1, 5, 100]
+    assert report == ["Replaced 1 value(s) in 'qty' above max with 100.0."]
+
+    # A fractional bound cannot be held by an int column
+    schema = Schema(rules={"qty": {"dtype": "int", "min": 1.5, "max": 100}})
+    cleaned, _ = clean_and_validate(df, schema)
+    assert cleaned["qty"].dtype == "float64"
+    assert cleaned["qty"].tolist() == [1.5, 5.0, 100.0]
+
+
+def test_min_max_fills_keep_nullable_dtype():
+    df = pd.DataFrame({"qty": pd.array([5, None, 50, -3], dtype="Int64")})
+    schema = Schema(rules={"qty": {"dtype": "int", "min": 0, "max": 10}})
+
+    cleaned, _ = clean_and_validate(df, schema)
+
+    assert cleaned["qty"].dtype == "Int64"
+    assert cleaned["qty"].tolist() == [5, pd.NA, 10, 0]
+
+
+def test_allowed_values_fills_keep_nullable_dtype():
+    df = pd.DataFrame({"level": pd.array([1, None, 7, 2], dtype="Int64")})
+    schema = Schema(rules={"level": {"dtype": "int", "allowed_values": [1, 2, 3], "fillna": 1}})
+
+    cleaned, _ = clean_and_validate(df, schema)
+
+    assert cleaned["level"].dtype == "Int64"
+    assert cleaned["level"].tolist() == [1, 1, 1, 2]
+
+
 def test_custom_validator_replace():
     df = pd.DataFrame({
         "score": [10, -5, 15, -1]
@@ -161,6 +297,590 @@ def test_custom_validator_replace():
     assert any("invalid custom values" in m for m in report)
 
 
+def test_custom_validator_vectorized_drop():
+    df = pd.DataFrame({
+        "score": [10, -5, 15, -1]
+    })
+
+    schema = Schema(
+        rules={
+            "score": {
+                "dtype": "int",
+                "drop_if_invalid": True,
+                "custom_validator_vectorized": lambda s: s >= 0
+            }
+        }
+    )
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # negatives dropped in a single vectorized pass
+    assert cleaned["score"].tolist() == [10, 15]
+    assert any("2 value(s) failed custom validation in 'score'" in m for m in report)
+
+
+def test_input_dataframe_is_not_modified():
+    df = pd.DataFrame({
+        "age": [20.0, None, 150.0]
+    })
+    original = df.copy()
+
+    schema = Schema(
+        rules={
+            "age": {
+                "dtype": "float",
+                "allow_null": False,
+                "fillna": 0,
+                "min": 0,
+                "max": 120,
+            }
+        }
+    )
+
+    cleaned, _ = clean_and_validate(df, schema)
+
+    assert cleaned["age"].tolist() == [20.0, 0.0, 120.0]
+    pd.testing.assert_frame_equal(df, original)
+
+
+def test_parallel_column_validation_matches_sequential():
+    n = 60_000
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "a": rng.integers(-10, 110, n),
+        "b": rng.normal(50, 30, n),
+        "c": rng.choice(["x", "y", "z"], n),
+        "d": rng.integers(0, 1000, n),
+    })
+
+    schema = Schema(
+        rules={
+            "a": {"dtype": "int", "min": 0, "max": 100, "drop_if_invalid": True},
+            "b": {"dtype": "float", "min": 0, "max": 100},
+            "c": {"dtype": "category", "allowed_values": ["x", "y"], "fillna": "x"},
+            "d": {"dtype": "int", "min": 10, "drop_if_invalid": True},
+        }
+    )
+
+    parallel, parallel_report = clean_and_validate(df, schema, max_workers=4)
+    sequential, sequential_report = clean_and_validate(df, schema, max_workers=1)
+
+    pd.testing.assert_frame_equal(parallel, sequential)
+    assert parallel_report == sequential_report
+
+
+def test_streaming_matches_in_memory(tmp_path):
+    df = pd.DataFrame({
+        "qty": [1, -2, 3, None, 5, 600, 7],
+        "cat": ["a", "b", "x", "a", "b", "a", "y"],
+    })
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    schema = Schema(
+        rules={
+            "qty": {"dtype": "float", "min": 0, "max": 100, "drop_if_invalid": True},
+            "cat": {"dtype": "category", "allowed_values": ["a", "b"], "fillna": "a"},
+        }
+    )
+
+    expected, _ = clean_and_validate(df, schema)
+    from_df, _ = clean_and_validate_streaming(df, schema, batch_size=3)
+    from_csv, report = clean_and_validate_streaming(path, schema, batch_size=3)
+
+    pd.testing.assert_frame_equal(from_df, expected)
+    pd.testing.assert_frame_equal(from_csv, expected)
+    assert any("below min marked for drop" in m for m in report)
+
+
+def test_streaming_csv_keeps_leading_zeros(tmp_path):
+    df = pd.DataFrame({"zip": ["01234", "98765", "12ab3", "00042"], "qty": [1, 2, 3, 4]}, dtype=str)
+    path = tmp_path / "zips.csv"
+    df.to_csv(path, index=False)
+
+    schema = Schema(rules={
+        "zip": {"dtype": "string", "regex": r"^\d{5}$", "drop_if_invalid": True},
+        "qty": {"dtype": "int"},
+    })
+
+    expected, _ = clean_and_validate(df, schema)
+    from_csv, _ = clean_and_validate_streaming(path, schema, batch_size=2)
+
+    assert from_csv["zip"].tolist() == ["01234", "98765", "00042"]
+    pd.testing.assert_frame_equal(from_csv, expected)
+
+
+def test_compiled_schema_is_reusable():
+    schema = Schema(
+        rules={
+            "age": {"dtype": "int", "min": 0, "max": 120, "drop_if_invalid": True},
+            "name": {"dtype": "string", "allow_null": False, "fillna": "Unknown"},
+        }
+    )
+    compiled = schema.compile()
+
+    for ages in ([25, -1, 40], [130, 50, 60]):
+        df = pd.DataFrame({"age": ages, "name": ["a", None, "c"]})
+        expected, expected_report = clean_and_validate(df, schema)
+        cleaned, report = clean_and_validate(df, compiled)
+
+        pd.testing.assert_frame_equal(cleaned, expected)
+        assert report == expected_report
+        assert len(cleaned) == 2
+
+
+def test_already_typed_columns_are_left_unchanged():
+    df = pd.DataFrame({
+        "age": pd.Series([25, 40], dtype="int32"),
+        "joined": pd.to_datetime(["2024-01-01", "2024-02-01"]),
+        "tier": pd.Categorical(["gold", "silver"]),
+    })
+    schema = Schema(
+        rules={
+            "age": {"dtype": "int"},
+            "joined": {"dtype": "datetime"},
+            "tier": {"dtype": "category"},
+        }
+    )
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    pd.testing.assert_frame_equal(cleaned, df)
+    assert report == []
+
+
+def test_validate_columns_match_per_column_validation():
+    df = pd.DataFrame({
+        "zip": ["12345", "abcde", None, "67890"],
+        "alt_zip": ["1234", "54321", "11111", None],
+        "code": [12345, 22, 33333, 44444],
+        "age": [25, None, 40, 130],
+    })
+    rules = Schema(
+        rules={
+            "zip": {"dtype": "string", "regex": r"\d{5}$", "fillna": "00000"},
+            "alt_zip": {"dtype": "string", "regex": r"\d{5}$", "drop_if_invalid": True},
+            "code": {"dtype": "string", "regex": r"\d{5}$", "drop_if_invalid": True},
+            "age": {"dtype": "float", "allow_null": False, "fillna": "median", "min": 0},
+            "missing": {"dtype": "int"},
+        }
+    ).rules
+
+    expected_df, expected_report, expected_drop = df.copy(), [], np.zeros(len(df), dtype=bool)
+    for col, rule in rules.items():
+        if col not in expected_df.columns:
+            expected_report.append(f"Column '{col}' is missing from DataFrame.")
+            continue
+        expected_df, col_drop = validate_column(expected_df, col, rule, expected_report)
+        expected_drop |= col_drop.to_numpy()
+
+    report = []
+    cleaned, rows_to_drop = validate_columns(df.copy(), rules, report)
+
+    pd.testing.assert_frame_equal(cleaned, expected_df)
+    assert report == expected_report
+    assert rows_to_drop.tolist() == expected_drop.tolist() == [True, True, False, False]
+
+    parallel_report = []
+    parallel, parallel_rows_to_drop = validate_columns_parallel(df.copy(), rules, parallel_report, max_workers=2)
+
+    pd.testing.assert_frame_equal(parallel, expected_df)
+    assert parallel_report == expected_report
+    assert parallel_rows_to_drop.tolist() == expected_drop.tolist()
+
+
+def test_empty_dataframe_is_only_converted():
+    df = pd.DataFrame({"age": pd.Series([], dtype=object), "zip": pd.Series([], dtype=object)})
+    schema = Schema(
+        rules={
+            "age": {"dtype": "int", "min": 0, "unique": True},
+            "zip": {"dtype": "string", "regex": r"\d{5}$"},
+        },
+        dataframe_rule={
+            "no_duplicates": True,
+            "cross_validations": [{"type": "comparison", "condition": "age > 0", "action": "drop"}],
+        },
+    )
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned.empty
+    assert cleaned["age"].dtype == "int64"
+    assert cleaned["zip"].dtype == "string"
+    assert report == []
+
+
+def test_early_drop_skips_conversion_of_rows_failing_regex():
+    df = pd.DataFrame({"code": ["12345", "abc", "67890"], "amount": ["10", "oops", "30"]})
+    schema = Schema(rules={
+        "code": {"dtype": "string", "regex": r"^\d{5}$", "drop_if_invalid": True},
+        "amount": {"dtype": "int", "drop_if_invalid": True},
+        "zz": {"dtype": "string"},
+    })
+
+    expected, _ = clean_and_validate(df, schema)
+    cleaned, report = clean_and_validate(df, schema, early_drop=True)
+
+    pd.testing.assert_frame_equal(cleaned, expected, check_dtype=False)
+    assert cleaned["amount"].tolist() == [10, 30]
+    assert report[-1] == "Dropping 1 row(s) due to validation."
+    assert not any("amount" in message for message in report[:-1])
+    assert report.count("Column 'zz' is missing from DataFrame.") == 1
+
+
+def test_streaming_empty_dataframe_keeps_columns():
+    df = pd.DataFrame({"age": pd.Series([], dtype=object), "zip": pd.Series([], dtype=object)})
+    schema = Schema(rules={"age": {"dtype": "int"}, "zip": {"dtype": "string"}})
+
+    expected, _ = clean_and_validate(df, schema)
+    cleaned, report = clean_and_validate_streaming(df, schema, batch_size=10)
+
+    pd.testing.assert_frame_equal(cleaned, expected)
+    assert report == []
+
+
+def test_live_console_is_opt_in(capsys):
+    df = pd.DataFrame({"age": [25, -1]})
+    schema = Schema(rules={"age": {"dtype": "int", "min": 0, "fillna": 0}})
+
+    _, report = clean_and_validate(df, schema)
+    assert report
+    assert "below min" not in capsys.readouterr().out
+
+    _, live_report = clean_and_validate(df, schema, enable_live_console=True)
+    assert live_report == report
+    assert "below min" in capsys.readouterr().out
+
+
+def test_live_console_block_applies_unless_overridden(capsys):
+    from cleanframe.reporting import live_console
+
+    df = pd.DataFrame({"age": [25, -1]})
+    schema = Schema(rules={"age": {"dtype": "int", "min": 0, "fillna": 0}})
+
+    with live_console():
+        clean_and_validate(df, schema)
+        assert "below min" in capsys.readouterr().out
+
+        clean_and_validate(df, schema, enable_live_console=False)
+        assert "below min" not in capsys.readouterr().out
+
+
+def test_regex_follows_changes_to_the_rule():
+    df = pd.DataFrame({"code": ["AB1", "ab2", "AB3"]})
+    schema = Schema(rules={"code": {"dtype": "string", "regex": r"^[A-Z]{2}\d$", "fillna": "XX0"}})
+
+    cleaned, report = clean_and_validate(df, schema)
+    assert cleaned["code"].tolist() == ["AB1", "XX0", "AB3"]
+    assert report == ["Replaced 1 value(s) in 'code' failing regex with XX0."]
+
+    # The compiled pattern is cached on the rule, but recompiled once the regex changes
+    schema.rules["code"].regex = r"^[a-z]{2}\d$"
+    cleaned, report = clean_and_validate(df, schema)
+    assert cleaned["code"].tolist() == ["XX0", "ab2", "XX0"]
+    assert report == ["Replaced 2 value(s) in 'code' failing regex with XX0."]
+
+
+def test_drops_from_different_columns_are_combined():
+    df = pd.DataFrame({
+        "a": [1, None, 3, 4, 5],
+        "b": ["x", "y", "!", "!", "z"],
+        "c": [1, 2, 3, 99, 98],
+    })
+    schema = Schema(rules={
+        "a": {"dtype": "float", "allow_null": False, "drop_if_invalid": True},
+        "b": {"dtype": "string", "regex": r"^[a-z]$", "drop_if_invalid": True},
+        "c": {"dtype": "int", "max": 10, "drop_if_invalid": True},
+    })
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # Rows 1, 2-3 and 3-4 are marked by different columns; row 3 by two of them
+    assert cleaned.to_dict("list") == {"a": [1.0], "b": ["x"], "c": [1]}
+    assert report == [
+        "1 null(s) in 'a' marked for drop.",
+        "2 value(s) in 'b' failed regex validation and were marked for drop.",
+        "2 value(s) in 'c' above max marked for drop.",
+        "Dropping 4 row(s) due to validation.",
+    ]
+
+
+def test_min_max_fills_leave_nan_untouched():
+    df = pd.DataFrame({"x": [0.5, np.nan, 12.0, -3.0]})
+    schema = Schema(rules={"x": {"dtype": "float", "min": 0, "max": 10}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["x"].dtype == "float64"
+    assert cleaned["x"].tolist()[2:] == [10.0, 0.0]
+    assert cleaned["x"].iloc[0] == 0.5 and np.isnan(cleaned["x"].iloc[1])
+    assert report == [
+        "Replaced 1 value(s) in 'x' below min with 0.",
+        "Replaced 1 value(s) in 'x' above max with 10.",
+    ]
+
+
+def test_rules_without_violations_report_nothing():
+    df = pd.DataFrame({"x": [1, 2, 3], "s": ["ab", "cd", None]})
+    schema = Schema(rules={
+        "x": {"dtype": "int", "min": 0, "max": 5, "allowed_values": [1, 2, 3], "unique": True},
+        "s": {"dtype": "string", "regex": "^[a-z]+$"},
+    })
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["x"].tolist() == [1, 2, 3]
+    assert cleaned["s"].tolist()[:2] == ["ab", "cd"] and pd.isna(cleaned["s"].iloc[2])
+    assert report == []
+
+
+def test_later_stages_see_filled_nulls():
+    df = pd.DataFrame({"n": [1.0, None, 20.0], "m": pd.Series(["1", None, "x"], dtype=object)})
+    schema = Schema(rules={
+        "n": {"dtype": "float", "allow_null": False, "fillna": "mean", "max": 10},
+        "m": {"dtype": "float"},
+    })
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # The filled mean (10.5) is then clamped by `max` like any other value
+    assert cleaned["n"].tolist() == [1.0, 10.0, 10.0]
+    # Only "x" is counted as coerced; the existing null is not
+    assert cleaned["m"].iloc[0] == 1.0 and cleaned["m"].iloc[1:].isna().all()
+    assert report == [
+        "Filled 1 null(s) in 'n' with 10.5 (strategy=mean).",
+        "Replaced 2 value(s) in 'n' above max with 10.",
+        "1 value(s) in 'm' coerced to NaN.",
+    ]
+
+
+def test_numeric_fills_rebuild_columns_in_place():
+    df = pd.DataFrame({"i": [1, 7, 2], "f": [0.5, -1.0, 20.0]})
+    schema = Schema(rules={
+        "i": {"dtype": "int", "allowed_values": [1, 2], "fillna": 2},
+        "f": {"dtype": "float", "min": 0, "max": 10},
+    })
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["i"].dtype == "int64" and cleaned["i"].tolist() == [1, 2, 2]
+    assert cleaned["f"].dtype == "float64" and cleaned["f"].tolist() == [0.5, 0.0, 10.0]
+    assert report == [
+        "Replaced 1 disallowed value(s) in 'i' with 2.",
+        "Replaced 1 value(s) in 'f' below min with 0.",
+        "Replaced 1 value(s) in 'f' above max with 10.",
+    ]
+
+
+def test_dropped_rows_are_removed_by_position():
+    df = pd.DataFrame({"v": [1, -1, 2, -2]}, index=["a", "a", "b", "b"])
+    schema = Schema(rules={"v": {"dtype": "int", "min": 0, "drop_if_invalid": True}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # Repeated labels do not matter; the result gets a fresh RangeIndex
+    assert cleaned["v"].tolist() == [1, 2]
+    assert cleaned.index.equals(pd.RangeIndex(2))
+    assert report == ["2 value(s) in 'v' below min marked for drop.", "Dropping 2 row(s) due to validation."]
+
+
+def test_deferred_casts_only_see_surviving_rows():
+    df = pd.DataFrame({"code": ["A1", "bad", "B2"], "kind": ["x", "y", "x"]})
+    schema = Schema(rules={
+        "code": {"dtype": "string", "regex": r"^[A-Z]\d$", "drop_if_invalid": True},
+        "kind": {"dtype": "category"},
+    })
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # "y" only appeared in the dropped row, so it never becomes a category
+    assert cleaned["code"].tolist() == ["A1", "B2"]
+    assert isinstance(cleaned["kind"].dtype, pd.CategoricalDtype)
+    assert list(cleaned["kind"].cat.categories) == ["x"]
+    assert report == [
+        "1 value(s) in 'code' failed regex validation and were marked for drop.",
+        "Dropping 1 row(s) due to validation.",
+    ]
+
+
+def test_min_max_drops_count_each_side():
+    df = pd.DataFrame({"t": [5.0, -1.0, 50.0, 7.0, 60.0]})
+    schema = Schema(rules={"t": {"dtype": "float", "min": 0, "max": 10, "drop_if_invalid": True}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["t"].tolist() == [5.0, 7.0]
+    assert report == [
+        "1 value(s) in 't' below min marked for drop.",
+        "2 value(s) in 't' above max marked for drop.",
+        "Dropping 3 row(s) due to validation.",
+    ]
+
+
+def test_unique_keeps_first_occurrence_of_each_value():
+    df = pd.DataFrame({"id": [3, 1, 3, 2, 1, 3]})
+    schema = Schema(rules={"id": {"dtype": "int", "unique": True}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["id"].tolist() == [3, 1, 2]
+    assert report == [
+        "Found 5 duplicate value(s) in column 'id'.",
+        "Marked 3 duplicate row(s) in column 'id' for removal, keeping only unique entries.",
+        "Dropping 3 row(s) due to validation.",
+    ]
+
+
+@pytest.mark.parametrize("storage", ["python", "pyarrow"])
+def test_regex_on_string_storages(storage):
+    if storage == "pyarrow":
+        pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"zip": pd.Series(["12345", "1234", None, "67890"], dtype=pd.StringDtype(storage))})
+    schema = Schema(rules={"zip": {"dtype": "string", "regex": r"^\d{5}", "fillna": "00000"}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["zip"].tolist()[:2] == ["12345", "00000"] and cleaned["zip"].iloc[3] == "67890"
+    assert pd.isna(cleaned["zip"].iloc[2])
+    assert report == ["Replaced 1 value(s) in 'zip' failing regex with 00000."]
+
+
+def test_type_and_constraint_checks_mark_a_shared_drop_mask():
+    from cleanframe.schema import ColumnRule
+    from cleanframe.transformers import apply_constraints, convert_dtype
+
+    df = pd.DataFrame({"x": ["1", "x", "50"]})
+    report = []
+    rows = np.array([True, False, False])
+
+    df, mask = convert_dtype(df, "x", ColumnRule(dtype="int", drop_if_invalid=True), report, rows_to_drop=rows)
+
+    assert mask is rows
+    assert mask.tolist() == [True, True, False]
+    assert report == ["1 invalid type(s) in 'x' marked for drop."]
+
+    df, fresh = apply_constraints(df, "x", ColumnRule(dtype="int", max=10, drop_if_invalid=True), [])
+
+    assert fresh is not rows
+    assert fresh.tolist() == [False, False, True]
+
+
+@pytest.mark.parametrize("strategy, expected", [("median", 3.0), ("MIN", 1.0), ("max", 10.0), (-1.0, -1.0)])
+def test_fillna_strategies_fill_nulls_from_column_aggregates(strategy, expected):
+    df = pd.DataFrame({"a": [1, None, 3, 10]})
+    schema = Schema(rules={"a": {"dtype": "float", "allow_null": False, "fillna": strategy}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["a"].tolist() == [1.0, expected, 3.0, 10.0]
+    assert report == [f"Filled 1 null(s) in 'a' with {expected} (strategy={strategy})."]
+
+
+def test_unique_on_object_column_with_nulls():
+    df = pd.DataFrame({"k": pd.Series(["a", None, "b", "a", np.nan, "c", "a"], dtype=object)})
+    schema = Schema(rules={"k": {"dtype": "object", "unique": True}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["k"].dtype == object
+    values = cleaned["k"].tolist()
+    assert values[0] == "a" and pd.isna(values[1]) and values[2:] == ["b", "c"]
+    assert report == [
+        "Found 5 duplicate value(s) in column 'k'.",
+        "Marked 3 duplicate row(s) in column 'k' for removal, keeping only unique entries.",
+        "Dropping 3 row(s) due to validation.",
+    ]
+
+
+def test_regex_drop_on_mixed_object_column():
+    df = pd.DataFrame({"z": pd.Series(["12345", 12345, "1234x", None, 678], dtype=object)})
+    schema = Schema(rules={"z": {"dtype": "object", "regex": r"^\d{5}$", "drop_if_invalid": True}})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["z"].dtype == object
+    assert cleaned["z"].tolist() == ["12345", 12345, None]
+    assert report == [
+        "2 value(s) in 'z' failed regex validation and were marked for drop.",
+        "Dropping 2 row(s) due to validation.",
+    ]
+
+
+def test_validate_column_returns_mask_on_the_frame_index():
+    df = pd.DataFrame({"v": [1, -1, 2]}, index=["r1", "r2", "r3"])
+    schema = Schema(rules={"v": {"dtype": "int", "min": 0, "drop_if_invalid": True}})
+
+    report = []
+    _, rows_to_drop = validate_column(df, "v", schema.rules["v"], report)
+
+    pd.testing.assert_series_equal(rows_to_drop, pd.Series([False, True, False], index=["r1", "r2", "r3"]))
+
+
+def test_parallel_column_steps_match_sequential_run():
+    from cleanframe.validators import compile_column, run_column_steps, run_column_steps_parallel
+
+    df = pd.DataFrame({
+        "a": [1, -1, 2, 3, 4, 5],
+        "b": [1.0, 2.0, None, 4.0, 5.0, 6.0],
+        "c": ["x", "y", "x", "z", "x", "y"],
+        "d": [10, 20, 30, 40, 50, 60],
+    })
+    schema = Schema(rules={
+        "a": {"dtype": "int", "min": 0, "drop_if_invalid": True},
+        "b": {"dtype": "float", "allow_null": False, "fillna": 0.0},
+        "c": {"dtype": "str", "allowed_values": ["x", "y"], "drop_if_invalid": True},
+        "d": {"dtype": "int", "max": 40, "drop_if_invalid": True},
+    })
+    steps = [compile_column(col, rule) for col, rule in schema.rules.items()]
+
+    results = []
+    for parallel in (False, True):
+        frame = df.copy()
+        report = []
+        rows_to_drop = np.zeros(len(frame), dtype=bool)
+        rows_to_drop[0] = True
+        if parallel:
+            run_column_steps_parallel(frame, steps, report, rows_to_drop, max_workers=3)
+        else:
+            run_column_steps(frame, steps, report, rows_to_drop)
+        results.append((frame, report, rows_to_drop))
+
+    (seq_df, seq_report, seq_rows), (par_df, par_report, par_rows) = results
+    assert seq_rows.tolist() == [True, True, False, True, True, True]
+    assert par_rows.tolist() == seq_rows.tolist()
+    assert par_report == seq_report
+    pd.testing.assert_frame_equal(par_df, seq_df)
+
+
+@pytest.mark.parametrize("dtype", [object, "string"])
+def test_regex_invalid_mask_matches_string_columns_in_place(dtype):
+    import re
+    from cleanframe.validators import _regex_invalid_mask
+
+    series = pd.Series(["123", None, "12a", "456"], dtype=dtype)
+
+    mask = _regex_invalid_mask(series, re.compile(r"^\d+$"))
+
+    assert mask.tolist() == [False, False, True, False]
+    assert series.dtype == dtype
+
+
+@pytest.mark.parametrize("values, dtype, fill", [([1, 2, 3], "int64", 9), (["a", "b", "c"], object, "z"), (["a", None, "c"], "string", "z")])
+def test_column_context_fill_keeps_the_column_dtype(values, dtype, fill):
+    from cleanframe.utils import ColumnContext
+
+    df = pd.DataFrame({"col": pd.Series(values, dtype=dtype)})
+    ctx = ColumnContext.from_series(df["col"])
+    mask = np.array([False, True, False])
+
+    ctx.fill(df, "col", mask, fill)
+
+    assert df["col"].dtype == dtype
+    assert df["col"].tolist() == [values[0], fill, values[2]]
+    assert not ctx.null_mask.any()
+    assert ctx.series is df["col"] or ctx.series.equals(df["col"])
+
+
 # --------------------------
 # DataFrame-level validations
 # --------------------------
@@ -256,6 +976,44 @@ def test_df_row_count_bounds_and_cross_validations():
     assert any("Conditional check failed: If (age > 18) then (email.notna())" in m for m in report)
 
 
+def test_df_comparison_drops_report_rows_removed_by_each_check():
+    df = pd.DataFrame({"start": [1, 5, 2, 9, 3], "end": [2, 4, 3, 1, 1], "qty": [1, 0, 2, 0, 0]})
+
+    schema = Schema(
+        rules={},
+        dataframe_rule={
+            "cross_validations": [
+                {"type": "comparison", "condition": "start <= end", "action": "drop"},
+                {"type": "comparison", "condition": "qty > 0", "action": "drop"},
+            ]
+        }
+    )
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # rows 1, 3 and 4 fail the first check; of the rest, none fail the second
+    assert cleaned["start"].tolist() == [1, 2]
+    assert "Dropped 3 row(s) failing comparison: start <= end" in report
+    assert not any("qty > 0" in m for m in report)
+
+
+def test_df_comparison_drops_on_whole_column_attributes_run_in_order():
+    df = pd.DataFrame({"e": [1, 2, 3, 4, 5]})
+    schema = Schema(rules={}, dataframe_rule={"cross_validations": [
+        {"type": "comparison", "condition": "e > 1", "action": "drop"},
+        {"type": "comparison", "condition": "e < e.size", "action": "drop"},
+    ]})
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    # `e.size` is 4 once the first check has dropped a row
+    assert cleaned["e"].tolist() == [2, 3]
+    assert report == [
+        "Dropped 1 row(s) failing comparison: e > 1",
+        "Dropped 2 row(s) failing comparison: e < e.size",
+    ]
+
+
 def test_df_min_max_rows_only_warn():
     df = pd.DataFrame({"x": [1, 2]})
 
@@ -273,3 +1031,161 @@ def test_df_min_max_rows_only_warn():
     assert len(cleaned) == 2
     assert any("expected at least 5" in m for m in report)
     assert any("exceeds max of 1" in m for m in report)
+
+
+def test_df_cross_validations_see_the_original_index():
+    index = pd.DatetimeIndex(["2024-01-01", "2024-01-02", "2024-01-03"])
+    df = pd.DataFrame({"x": [-1, 2, 3]}, index=index)
+    schema = Schema(
+        rules={"x": {"dtype": "int"}},
+        dataframe_rule={"cross_validations": [
+            {"type": "aggregate", "check": "df.loc['2024-01-02':, 'x'].sum() > 0", "action": "warn"},
+            {"type": "comparison", "condition": "index >= '2024-01-02'", "action": "drop"},
+        ]},
+    )
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["x"].tolist() == [2, 3]
+    assert cleaned.index.equals(pd.RangeIndex(2))
+    assert not any("Aggregate" in m or "error" in m.lower() for m in report)
+
+
+def test_df_malformed_cross_validations_are_reported_individually():
+    df = pd.DataFrame({"start": [1, 5, 3], "end": [2, 4, 6]})
+    schema = Schema(rules={}, dataframe_rule={"cross_validations": [
+        {"type": "comparison", "condition": "start <= end", "action": "drop"},
+        {"type": "comparison", "condition": ["start"], "action": "drop"},
+    ]})
+    schema.dataframe_rule.cross_validations.append("not a dict")
+
+    cleaned, report = clean_and_validate(df, schema)
+
+    assert cleaned["start"].tolist() == [1, 3]
+    assert report[0] == "Dropped 1 row(s) failing comparison: start <= end"
+    assert len(report) == 3
+    assert all(m.startswith("Error evaluating cross-validation") for m in report[1:])
+
+
+def test_df_cross_validations_changed_after_construction_are_applied():
+    df = pd.DataFrame({"start": [1, 5, 3], "end": [2, 4, 6]})
+    schema = Schema(rules={}, dataframe_rule={"cross_validations": []})
+    clean_and_validate(df, schema)
+
+    schema.dataframe_rule.cross_validations.append({"type": "comparison", "condition": "start <= end", "action": "drop"})
+    cleaned, _ = clean_and_validate(df, schema)
+    assert cleaned["start"].tolist() == [1, 3]
+
+    schema.dataframe_rule.cross_validations = [{"type": "comparison", "condition": "end > 2", "action": "drop"}]
+    cleaned, _ = clean_and_validate(df, schema)
+    assert cleaned["end"].tolist() == [4, 6]
+
+
+def test_df_expected_columns_changed_after_construction_are_applied():
+    df = pd.DataFrame({"a": [1], "b": [2]})
+    schema = Schema(rules={}, dataframe_rule={"expected_columns": ["a"]})
+    _, report = clean_and_validate(df, schema)
+    assert any("Unexpected extra columns: ['b']" in m for m in report)
+
+    schema.dataframe_rule.expected_columns.append("b")
+    _, report = clean_and_validate(df, schema)
+    assert not any("columns" in m for m in report)
+
+    schema.dataframe_rule.expected_columns = ["a", "c"]
+    _, report = clean_and_validate(df, schema)
+    assert any("Missing expected columns: ['c']" in m for m in report)
+    assert any("Unexpected extra columns: ['b']" in m for m in report)
+
+
+def test_df_compiled_conditions_evaluate_like_df_eval():
+    from cleanframe import validators
+
+    df = pd.DataFrame({"a": [4, 3, -3, -4], "b": [2, 0, 0, -1], "name": ["x", None, "y", "z"]})
+    for expr in ("a <= b", "a * b > -1", "a / b >= 0", "-a < b ** 2", "name.notna()"):
+        assert validators._compile_condition(expr) is not None, expr
+        pd.testing.assert_series_equal(validators._eval_condition(df, expr), df.eval(expr), check_names=False)
+
+    # Pandas parses or evaluates these differently from Python, so they fall back to df.eval
+    for expr in ("a // b >= 0", "a % b == 0", "a > 0 and b > 0", "0 < a < 4", "a in [3, 4]"):
+        assert validators._compile_condition(expr) is None, expr
+        pd.testing.assert_series_equal(validators._eval_condition(df, expr), df.eval(expr), check_names=False)
+
+
+def test_df_aggregate_checks_reject_private_names():
+    df = pd.DataFrame({"sales": [10, 20]})
+
+    def run(expr):
+        schema = Schema(rules={}, dataframe_rule={"cross_validations": [{"type": "aggregate", "check": expr}]})
+        _, report = clean_and_validate(df, schema)
+        return report
+
+    assert run("df['sales'].sum() > 0 and len(df) == 2") == []
+    assert run("np.abs(df['sales']).max() > 100") == ["Aggregate check failed: np.abs(df['sales']).max() > 100"]
+
+    # Rejected before evaluation
+    for expr in ("__import__('os').getcwd()", "df.__class__.__name__ == 'DataFrame'"):
+        report = run(expr)
+        assert len(report) == 1 and "is not allowed in aggregate checks" in report[0], expr
+
+    # Not among the available builtins
+    report = run("open('setup.py')")
+    assert len(report) == 1 and "name 'open' is not defined" in report[0]
+
+
+@pytest.mark.parametrize("action", ["drop", "warn"])
+def test_df_conditional_checks_only_apply_where_the_premise_holds(action):
+    df = pd.DataFrame({"country": ["US", "US", "CA", None], "state": ["NY", None, None, None]})
+
+    schema = Schema(
+        rules={},
+        dataframe_rule={
+            "cross_validations": [
+                {"type": "conditional", "if": "country == 'US'", "then": "state.notnull()", "action": action}
+            ]
+        }
+    )
+
+    report = []
+    result = validate_dataframe(df, schema.dataframe_rule, report)
+
+    if action == "drop":
+        assert result["country"].tolist()[:2] == ["US", "CA"]
+        assert pd.isna(result["country"].iloc[2])
+        assert result["state"].tolist()[0] == "NY"
+        assert report == ["Dropped 1 row(s) failing conditional: If (country == 'US') then (state.notnull())"]
+    else:
+        assert len(result) == 4
+        assert report == ["Conditional check failed: If (country == 'US') then (state.notnull())"]
+
+
+def test_df_no_duplicates_on_small_frames():
+    schema = Schema(rules={}, dataframe_rule={"no_duplicates": True})
+
+    report = []
+    result = validate_dataframe(pd.DataFrame({"a": [1, 1, 2, 1], "b": ["x", "x", "y", "x"]}), schema.dataframe_rule, report)
+
+    assert list(result.itertuples(index=False, name=None)) == [(1, "x"), (2, "y")]
+    assert report == ["Removed 2 duplicate row(s)."]
+
+    report = []
+    result = validate_dataframe(pd.DataFrame({"a": [1], "b": ["x"]}), schema.dataframe_rule, report)
+
+    assert len(result) == 1
+    assert report == []
+
+
+@pytest.mark.filterwarnings("error")
+def test_df_cross_validation_drop_does_not_touch_the_input():
+    df = pd.DataFrame({"a": [1, 5, 2, 7], "b": [2, 4, 3, 1]})
+    original = df.copy()
+    schema = Schema(
+        rules={},
+        dataframe_rule={"cross_validations": [{"type": "comparison", "condition": "a < b", "action": "drop"}]}
+    )
+
+    report = []
+    result = validate_dataframe(df, schema.dataframe_rule, report)
+    result["a"] = 0
+
+    pd.testing.assert_frame_equal(df, original)
+    assert report == ["Dropped 2 row(s) failing comparison: a < b"]